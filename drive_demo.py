@@ -17,17 +17,158 @@ Make sure:
 """
 
 import argparse
+import ctypes
+import gc
+import os
+import platform
+import queue
 import struct
 import sys
+import threading
 import time
 from pathlib import Path
 
-REPO_ROOT = Path(__file__).resolve().parent
-PY_SOEM_PATH = REPO_ROOT / "pysoem-master"
-if PY_SOEM_PATH.exists():
-    sys.path.insert(0, str(PY_SOEM_PATH))
-
-import pysoem
+try:
+    import pysoem
+except ImportError:
+    # Fall back to the vendored tree; no .resolve()/stat when the installed
+    # package is importable.
+    sys.path.insert(0, str(Path(__file__).parent / "pysoem-master"))
+    import pysoem
+
+# Precompiled codecs for the mapped PDO layouts (see LC10ECsvDemo._map_pdos):
+# RxPDO = controlword(u16) + modes of operation(s8) + target velocity(s32),
+# TxPDO = statusword(u16) + velocity actual(s32) + mode display(s8).
+_OUT_PDO = struct.Struct("<Hbi")
+_IN_PDO = struct.Struct("<Hi")
+_MODE_DISPLAY_OFFSET = _IN_PDO.size
+
+# Bound on one PDO round-trip, matching SOEM's EC_TIMEOUTRET; deliberately
+# much tighter than the cycle time so a late frame cannot eat the next cycle.
+RECEIVE_TIMEOUT_US = 2_000
+
+# Below this much slack a kernel sleep tends to overshoot the deadline;
+# burn the remainder spinning instead.
+_SPIN_THRESHOLD_NS = 50_000
+
+# Opt-in: use SOEM's overlapping process data so frame n+1 is on the wire
+# before frame n's reception is reaped, hiding one wire time per cycle.
+# Off by default until A/B-tested against the serial path on real hardware.
+USE_OVERLAP = False
+
+# CiA402 state names indexed by the masked statusword (mask 0x006F), built
+# once so decoding does not allocate a dict per call.
+_STATE_LOOKUP = [None] * 0x70
+for _val, _name in (
+    (0x0000, "Not ready to switch on"),
+    (0x0001, "Switch on disabled (step)"),
+    (0x0003, "Switch on disabled / transition"),
+    (0x0004, "Switch on disabled"),
+    (0x0040, "Switch on disabled"),
+    (0x0021, "Ready to switch on"),
+    (0x0023, "Switched on"),
+    (0x0027, "Operation enabled"),
+    (0x0007, "Quick stop active"),
+    (0x000F, "Fault reaction active"),
+    (0x0008, "Fault"),
+):
+    _STATE_LOOKUP[_val] = _name
+del _val, _name
+
+# Poll pacing for the state-machine waits (fault reset / mode check / enable):
+# start fast so a drive that reacts within a cycle or two is caught
+# immediately, then back off exponentially to the old fixed 50 ms rate.
+_POLL_MIN_NS = 200_000
+_POLL_MAX_NS = 50_000_000
+
+# CiA402 dispatch keyed on the drive's current masked statusword: command
+# whatever transition applies *now*, so a drive that is already partway
+# enabled (e.g. Switched on after a warm restart) advances from there
+# instead of replaying the whole sequence.  None marks the goal state;
+# states not in the table funnel through shutdown into Ready to switch on.
+_STATE_TABLE = {
+    0x0021: 0x0007,  # Ready to switch on -> switch on
+    0x0023: 0x000F,  # Switched on        -> enable operation
+    0x0027: None,    # Operation enabled  -> done
+}
+
+# Scalar codecs for SDO payloads.
+_U8 = struct.Struct("B")
+_S8 = struct.Struct("b")
+
+# Constant SDO payloads for the PDO mapping, built once at import.
+_ZERO_U8 = _U8.pack(0)
+_RX_MAP_1600 = struct.pack("<BxIII", 3, 0x6040_0010, 0x6060_0008, 0x60FF_0020)
+_RX_ASSIGN_1C12 = struct.pack("<BxH", 1, 0x1600)
+_TX_MAP_1A00 = struct.pack("<BxIII", 3, 0x6041_0010, 0x606C_0020, 0x6061_0008)
+_TX_ASSIGN_1C13 = struct.pack("<BxH", 1, 0x1A00)
+
+
+# CPython does not expose clock_nanosleep (time.sleep only uses it
+# internally, without TIMER_ABSTIME), so go through libc for the absolute
+# sleep.  glibc only; on musl or non-Linux the relative fallback is used.
+_libc = None
+if platform.system() == "Linux":
+    try:
+        _libc = ctypes.CDLL("libc.so.6", use_errno=True)
+    except OSError:
+        _libc = None
+
+
+if _libc is not None:
+
+    class _Timespec(ctypes.Structure):
+        _fields_ = (("tv_sec", ctypes.c_long), ("tv_nsec", ctypes.c_long))
+
+    _TIMER_ABSTIME = 1  # linux/time.h
+    _EINTR = 4
+
+    def _sleep_until(deadline_ns: int) -> None:
+        """Sleep until an absolute CLOCK_MONOTONIC deadline (no drift)."""
+        if deadline_ns - time.monotonic_ns() > _SPIN_THRESHOLD_NS:
+            ts = _Timespec(deadline_ns // 1_000_000_000, deadline_ns % 1_000_000_000)
+            while _libc.clock_nanosleep(
+                time.CLOCK_MONOTONIC, _TIMER_ABSTIME, ctypes.byref(ts), None
+            ) == _EINTR:
+                pass
+        while time.monotonic_ns() < deadline_ns:
+            pass
+
+else:  # No absolute sleep available: relative wait, spin out the remainder.
+
+    def _sleep_until(deadline_ns: int) -> None:
+        remaining_ns = deadline_ns - time.monotonic_ns()
+        if remaining_ns > _SPIN_THRESHOLD_NS:
+            time.sleep(remaining_ns / 1e9)
+        while time.monotonic_ns() < deadline_ns:
+            pass
+
+
+def _apply_realtime(core: int, prio: int) -> None:
+    """Pin this thread to one CPU and switch it to SCHED_FIFO (Linux only).
+
+    For best results isolate the core from the kernel scheduler
+    (``isolcpus=<core>`` on the kernel command line) and allow the rtprio in
+    /etc/security/limits.conf (e.g. ``* hard rtprio 99``); otherwise this
+    needs root/CAP_SYS_NICE.
+    """
+    if platform.system() != "Linux":
+        return
+    try:
+        os.sched_setaffinity(0, {core})
+        os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(prio))
+    except OSError as exc:
+        print(f"Realtime setup skipped: {exc} (needs rtprio limits or CAP_SYS_NICE).")
+    try:
+        # Fault the whole address space in now so the cycle never page-faults.
+        if _libc is None:
+            raise OSError(0, "libc not loaded")
+        mcl_current_and_future = 1 | 2
+        if _libc.mlockall(mcl_current_and_future) != 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno))
+    except OSError as exc:
+        print(f"mlockall skipped: {exc} (needs memlock limits or CAP_IPC_LOCK).")
 
 
 class LC10ECsvDemo:
@@ -48,37 +189,54 @@ class LC10ECsvDemo:
     STATE_SWITCHED_ON = 0x0023
     STATE_OPERATION_ENABLED = 0x0027
 
-    def __init__(self, iface: str, slave_index: int, target_rpm: float, duration: float):
+    # Consecutive short working counters tolerated before giving up; one-off
+    # frame loss is survivable, a sustained miss means a lost slave.
+    WKC_MISS_LIMIT = 10
+
+    def __init__(self, iface: str, slave_index: int, target_rpm: float, duration: float,
+                 cycle_ms: float = 10.0, rt_core: int = None, rt_prio: int = 80):
         self.iface = iface
         self.slave_index = slave_index
         self.target_rpm = target_rpm
         self.duration = duration
+        self.period_ns = int(cycle_ms * 1e6)
+        self.rt_core = rt_core
+        self.rt_prio = rt_prio
         self.master = pysoem.Master()
+        # Swapped for send_overlap_processdata in run() when USE_OVERLAP is set.
+        self._send_pd = self.master.send_processdata
+        # Reusable RxPDO image; re-sized to the mapped output length in run().
+        self._out_buf = bytearray(_OUT_PDO.size)
+        # Cached after config_map: crossing the pysoem C boundary for
+        # slaves[i]/len() on every cycle is avoidable work.
+        self._slave = None
+        self._expected_wkc = 0
+        self._wkc_misses = 0
+        # Samples from the cycle thread; formatted and printed by _log_worker
+        # so stdio never blocks the PDO loop.
+        self._log_q = queue.SimpleQueue()
+        self._log_thread = None
 
     # ------------------------------------------------------------------ PDO setup
     def _map_pdos(self, slave):
         """Configure Rx/Tx PDOs for CSV (controlword + mode + target velocity)."""
-        # Clear Rx assignment and map 0x1600: CW(16) + Modes(8) + TargetVel(32)
-        slave.sdo_write(0x1C12, 0, struct.pack("B", 0))
-        slave.sdo_write(0x1600, 0, struct.pack("B", 0))
-        slave.sdo_write(0x1600, 1, struct.pack("<I", 0x6040_0010))  # Controlword
-        slave.sdo_write(0x1600, 2, struct.pack("<I", 0x6060_0008))  # Modes of operation
-        slave.sdo_write(0x1600, 3, struct.pack("<I", 0x60FF_0020))  # Target velocity
-        slave.sdo_write(0x1600, 0, struct.pack("B", 3))
-        slave.sdo_write(0x1C12, 1, struct.pack("<H", 0x1600))
-        slave.sdo_write(0x1C12, 0, struct.pack("B", 1))
-
-        # Clear Tx assignment and map 0x1A00: SW(16) + VelActual(32)
-        slave.sdo_write(0x1C13, 0, struct.pack("B", 0))
-        slave.sdo_write(0x1A00, 0, struct.pack("B", 0))
-        slave.sdo_write(0x1A00, 1, struct.pack("<I", 0x6041_0010))  # Statusword
-        slave.sdo_write(0x1A00, 2, struct.pack("<I", 0x606C_0020))  # Velocity actual value
-        slave.sdo_write(0x1A00, 0, struct.pack("B", 2))
-        slave.sdo_write(0x1C13, 1, struct.pack("<H", 0x1A00))
-        slave.sdo_write(0x1C13, 0, struct.pack("B", 1))
-
-        # Set CSV mode via SDO for good measure.
-        slave.sdo_write(0x6060, 0, struct.pack("b", self.CSV_MODE))
+        # The assignments must be disabled while the mapping objects change;
+        # after that, complete access rewrites each object in one mailbox
+        # transaction instead of one per sub-index.
+        slave.sdo_write(0x1C12, 0, _ZERO_U8)
+        slave.sdo_write(0x1C13, 0, _ZERO_U8)
+
+        # 0x1600: CW(16) + Modes(8) + TargetVel(32)
+        slave.sdo_write(0x1600, 0, _RX_MAP_1600, ca=True)
+        slave.sdo_write(0x1C12, 0, _RX_ASSIGN_1C12, ca=True)
+
+        # 0x1A00: SW(16) + VelActual(32) + ModeDisplay(8)
+        slave.sdo_write(0x1A00, 0, _TX_MAP_1A00, ca=True)
+        slave.sdo_write(0x1C13, 0, _TX_ASSIGN_1C13, ca=True)
+
+        # Set CSV mode via SDO; the mapped mode display (0x6061) is checked
+        # over cyclic data in _verify_mode instead of an SDO read-back.
+        slave.sdo_write(0x6060, 0, _S8.pack(self.CSV_MODE))
 
     def _setup_slave(self, pos: int):
         slave = self.master.slaves[pos]
@@ -88,90 +246,137 @@ class LC10ECsvDemo:
     @staticmethod
     def _decode_state(status_word: int) -> str:
         state_val = status_word & 0x006F
-        return {
-            0x0000: "Not ready to switch on",
-            0x0001: "Switch on disabled (step)",
-            0x0003: "Switch on disabled / transition",
-            0x0004: "Switch on disabled",
-            0x0040: "Switch on disabled",
-            0x0021: "Ready to switch on",
-            0x0023: "Switched on",
-            0x0027: "Operation enabled",
-            0x0007: "Quick stop active",
-            0x000F: "Fault reaction active",
-            0x0008: "Fault",
-        }.get(state_val, f"Unknown (0x{state_val:04x})")
-
-    def _pack_outputs(self, slave, controlword: int, target_velocity: int) -> bytes:
-        """Pack CW + Modes + Target velocity into the mapped RxPDO layout."""
-        payload_len = len(slave.output)
-        payload = bytearray(payload_len)
-
-        struct.pack_into("<H", payload, 0, controlword)           # 0x6040
-        struct.pack_into("<b", payload, 2, self.CSV_MODE)         # 0x6060
-        struct.pack_into("<i", payload, 3, target_velocity)       # 0x60FF
-        return bytes(payload)
+        return _STATE_LOOKUP[state_val] or f"Unknown (0x{state_val:04x})"
+
+    def _pack_outputs(self, controlword: int, target_velocity: int) -> bytearray:
+        """Pack CW + Modes + Target velocity into the reusable RxPDO buffer."""
+        _OUT_PDO.pack_into(self._out_buf, 0, controlword, self.CSV_MODE, target_velocity)
+        return self._out_buf
 
     def _exchange_pd(self, controlword: int, target_velocity: int):
         """Write outputs, exchange PD, and parse inputs."""
-        slave = self.master.slaves[self.slave_index]
-        slave.output = self._pack_outputs(slave, controlword, target_velocity)
-
-        self.master.send_processdata()
-        self.master.receive_processdata(2_000)
+        slave = self._slave
+        # pysoem's output setter copies from a bytes object, so one conversion
+        # per cycle is unavoidable -- but we no longer allocate the bytearray too.
+        slave.output = bytes(self._pack_outputs(controlword, target_velocity))
+
+        self._send_pd()
+        wkc = self.master.receive_processdata(RECEIVE_TIMEOUT_US)
+        if wkc < self._expected_wkc:
+            self._wkc_misses += 1
+            if self._wkc_misses >= self.WKC_MISS_LIMIT:
+                raise RuntimeError(
+                    f"Working counter {wkc} below expected {self._expected_wkc} "
+                    f"for {self._wkc_misses} consecutive cycles; slave lost or cabling fault."
+                )
+        else:
+            self._wkc_misses = 0
 
-        status_word = struct.unpack_from("<H", slave.input, 0)[0] if len(slave.input) >= 2 else 0
-        vel_actual = struct.unpack_from("<i", slave.input, 2)[0] if len(slave.input) >= 6 else 0
-        return status_word, vel_actual
+        # PD sizes are validated once in run(); no per-cycle guard needed.
+        return _IN_PDO.unpack_from(slave.input, 0)
 
-    def _clear_faults(self) -> bool:
-        for _ in range(50):
+    def _clear_faults(self, timeout: float = 2.5) -> bool:
+        deadline_ns = time.monotonic_ns() + int(timeout * 1e9)
+        delay_ns = _POLL_MIN_NS
+        while time.monotonic_ns() < deadline_ns:
             status_word, _ = self._exchange_pd(self.CONTROLWORD_FAULT_RESET, 0)
             if (status_word & 0x0008) == 0:
                 return True
-            time.sleep(0.05)
-        return False
-
-    def _reach_state(self, expected_state: int, cw: int, vel: int, timeout: float = 5.0) -> bool:
-        deadline = time.time() + timeout
-        while time.time() < deadline:
-            status_word, _ = self._exchange_pd(cw, vel)
-            if (status_word & self.STATE_MASK) == expected_state:
-                return True
-            print(
-                f"  waiting for state 0x{expected_state:04x}; "
-                f"status 0x{status_word:04x} ({self._decode_state(status_word)})"
-            )
-            time.sleep(0.05)
+            _sleep_until(time.monotonic_ns() + delay_ns)
+            delay_ns = min(delay_ns * 2, _POLL_MAX_NS)
         return False
 
-    def _enable_drive(self, target_velocity: int):
+    def _verify_mode(self, timeout: float = 1.0):
+        """Confirm the drive reports CSV via the PDO-mapped mode display (0x6061)."""
+        deadline_ns = time.monotonic_ns() + int(timeout * 1e9)
+        delay_ns = _POLL_MIN_NS
+        while True:
+            self._exchange_pd(self.CONTROLWORD_SHUTDOWN, 0)
+            mode = _S8.unpack_from(self._slave.input, _MODE_DISPLAY_OFFSET)[0]
+            if mode == self.CSV_MODE:
+                return
+            if time.monotonic_ns() >= deadline_ns:
+                raise RuntimeError(f"Drive did not switch to CSV mode (0x6061 reports {mode}).")
+            _sleep_until(time.monotonic_ns() + delay_ns)
+            delay_ns = min(delay_ns * 2, _POLL_MAX_NS)
+
+    def _enable_drive(self, target_velocity: int, timeout: float = 10.0):
         if not self._clear_faults():
             raise RuntimeError("Drive is in fault and did not acknowledge reset (CW=0x0080).")
 
-        if not self._reach_state(self.STATE_READY, self.CONTROLWORD_SHUTDOWN, 0):
-            raise RuntimeError('Drive did not reach "Ready to switch on" (CW=0x0006).')
-
-        if not self._reach_state(self.STATE_SWITCHED_ON, self.CONTROLWORD_SWITCH_ON, 0):
-            raise RuntimeError('Drive did not reach "Switched on" (CW=0x0007).')
-
-        if not self._reach_state(self.STATE_OPERATION_ENABLED, self.CONTROLWORD_ENABLE, target_velocity):
-            raise RuntimeError('Drive did not reach "Operation enabled" (CW=0x000F).')
+        self._verify_mode()
 
-    def _hold_velocity(self, target_velocity: int):
-        start = time.time()
-        next_log = start
-        while time.time() - start < self.duration:
-            status_word, vel_actual = self._exchange_pd(self.CONTROLWORD_ENABLE, target_velocity)
-            now = time.time()
-            if now >= next_log:
-                approx_rpm = vel_actual * 60.0 / self.COUNTS_PER_REV
+        # Single PDO-driven loop dispatching on the drive's current state via
+        # _STATE_TABLE; each transition's controlword goes out on the very
+        # next cycle after the statusword changes.
+        deadline_ns = time.monotonic_ns() + int(timeout * 1e9)
+        delay_ns = _POLL_MIN_NS
+        cw = self.CONTROLWORD_SHUTDOWN
+        while True:
+            vel = target_velocity if cw == self.CONTROLWORD_ENABLE else 0
+            status_word, _ = self._exchange_pd(cw, vel)
+            next_cw = _STATE_TABLE.get(status_word & self.STATE_MASK, self.CONTROLWORD_SHUTDOWN)
+            if next_cw is None:
+                return
+            if next_cw != cw:
+                # State advanced: issue the next transition on the next cycle
+                # and poll fast again.
+                cw = next_cw
+                delay_ns = _POLL_MIN_NS
+                continue
+            if time.monotonic_ns() >= deadline_ns:
+                raise RuntimeError(
+                    f'Drive stalled in "{self._decode_state(status_word)}" during enable '
+                    f"(status 0x{status_word:04x}, CW=0x{cw:04x})."
+                )
+            if delay_ns >= _POLL_MAX_NS:
                 print(
-                    f"Status 0x{status_word:04x} ({self._decode_state(status_word)}) | "
-                    f"target {target_velocity} | actual raw {vel_actual} | ~rpm {approx_rpm:.1f}"
+                    f"  enabling with CW=0x{cw:04x}; "
+                    f"status 0x{status_word:04x} ({self._decode_state(status_word)})"
                 )
-                next_log = now + 0.5
-            time.sleep(0.01)
+            _sleep_until(time.monotonic_ns() + delay_ns)
+            delay_ns = min(delay_ns * 2, _POLL_MAX_NS)
+
+    def _log_worker(self):
+        """Format and print samples queued by _hold_velocity, off the cycle thread."""
+        while True:
+            sample = self._log_q.get()
+            if sample is None:
+                return
+            status_word, vel_actual, target_velocity = sample
+            approx_rpm = vel_actual * 60.0 / self.COUNTS_PER_REV
+            print(
+                f"Status 0x{status_word:04x} ({self._decode_state(status_word)}) | "
+                f"target {target_velocity} | actual raw {vel_actual} | ~rpm {approx_rpm:.1f}"
+            )
+
+    def _hold_velocity(self, target_velocity: int):
+        # Bind everything the loop touches to locals; at cycle rate each
+        # attribute/global lookup in the body is paid thousands of times.
+        exchange = self._exchange_pd
+        put_sample = self._log_q.put_nowait
+        monotonic_ns = time.monotonic_ns
+        sleep_until = _sleep_until
+        period_ns = self.period_ns
+        enable_cw = self.CONTROLWORD_ENABLE
+
+        start_ns = monotonic_ns()
+        end_ns = start_ns + int(self.duration * 1e9)
+        next_log_ns = start_ns
+        # Absolute-deadline pacing: each wakeup is scheduled from the previous
+        # deadline, not from "now", so PDO exchange time does not accumulate
+        # into cycle drift.
+        next_wake_ns = start_ns + period_ns
+        while monotonic_ns() < end_ns:
+            status_word, vel_actual = exchange(enable_cw, target_velocity)
+            now_ns = monotonic_ns()
+            if now_ns >= next_log_ns:
+                # Hand the raw ints to the log thread; formatting and stdio
+                # stay out of the cycle.
+                put_sample((status_word, vel_actual, target_velocity))
+                next_log_ns = now_ns + 500_000_000
+            sleep_until(next_wake_ns)
+            next_wake_ns += period_ns
 
         # Ramp down to zero target, then shutdown.
         self._exchange_pd(self.CONTROLWORD_ENABLE, 0)
@@ -179,6 +384,8 @@ class LC10ECsvDemo:
 
     # ------------------------------------------------------------------ main run
     def run(self):
+        if self.rt_core is not None:
+            _apply_realtime(self.rt_core, self.rt_prio)
         self.master.open(self.iface)
         try:
             if self.master.config_init() <= self.slave_index:
@@ -191,28 +398,61 @@ class LC10ECsvDemo:
 
             slave.config_func = self._setup_slave
 
-            self.master.config_map()
+            # The overlap sender only works against the overlapping IO map, so
+            # the mapping call and the sender have to be switched as a pair
+            # (send_overlap_processdata over a serial map returns WKC 0).
+            # Fall back to the serial pair if the binding predates the API.
+            if USE_OVERLAP and hasattr(self.master, "config_overlap_map"):
+                self.master.config_overlap_map()
+                self._send_pd = self.master.send_overlap_processdata
+            else:
+                self.master.config_map()
             if self.master.state_check(pysoem.SAFEOP_STATE, timeout=50_000) != pysoem.SAFEOP_STATE:
                 raise RuntimeError("Not all slaves reached SAFE_OP.")
 
             # Enter OP
             self.master.state = pysoem.OP_STATE
-            self.master.send_processdata()
-            self.master.receive_processdata(2_000)
+            self._send_pd()
+            self.master.receive_processdata(RECEIVE_TIMEOUT_US)
             self.master.write_state()
             if self.master.state_check(pysoem.OP_STATE, timeout=50_000) != pysoem.OP_STATE:
                 raise RuntimeError("Not all slaves reached OPERATIONAL.")
 
-            slave = self.master.slaves[self.slave_index]
+            # The reference from config_init is still valid here: the wrapper
+            # points into the master's C slave array, which the mapping step
+            # updates in place (pysoem builds Master.slaves once, in
+            # config_init).
             print(f"Process data sizes -> outputs: {len(slave.output)} bytes, inputs: {len(slave.input)} bytes")
+            if len(slave.input) <= _MODE_DISPLAY_OFFSET or len(slave.output) < _OUT_PDO.size:
+                raise RuntimeError(
+                    f"Unexpected process data sizes (need >= {_OUT_PDO.size} out / "
+                    f"{_MODE_DISPLAY_OFFSET + 1} in); PDO mapping did not apply."
+                )
+            self._slave = slave
+            self._expected_wkc = self.master.expected_wkc
+            self._out_buf = bytearray(len(slave.output))
 
             target_velocity_command = int(round(self.target_rpm))
             print(f"Setting CSV mode (0x6060 = 0x09) and commanding {target_velocity_command} rpm for {self.duration}s...")
 
+            self._log_thread = threading.Thread(target=self._log_worker, daemon=True)
+            self._log_thread.start()
+
             self._enable_drive(target_velocity_command)
-            self._hold_velocity(target_velocity_command)
+
+            # Collect once up front, then keep the collector out of the loop
+            # so it cannot pause a cycle mid-flight.
+            gc.collect()
+            gc.disable()
+            try:
+                self._hold_velocity(target_velocity_command)
+            finally:
+                gc.enable()
 
         finally:
+            if self._log_thread is not None:
+                self._log_q.put_nowait(None)
+                self._log_thread.join(timeout=1.0)
             self.master.state = pysoem.INIT_STATE
             self.master.write_state()
             self.master.close()
@@ -224,9 +464,14 @@ def main():
     parser.add_argument("--slave-index", type=int, default=0, help="Index of LC10E on the bus (default 0).")
     parser.add_argument("--rpm", type=float, default=10000.0, help="Target speed in rpm (0x60FF units).")
     parser.add_argument("--duration", type=float, default=60.0, help="Duration to hold speed before shutdown (s).")
+    parser.add_argument("--cycle-ms", type=float, default=10.0, help="PDO cycle time in ms (default 10).")
+    parser.add_argument("--rt-core", type=int, default=None,
+                        help="Pin the cyclic loop to this CPU with SCHED_FIFO (Linux only).")
+    parser.add_argument("--rt-prio", type=int, default=80, help="SCHED_FIFO priority for --rt-core (default 80).")
     args = parser.parse_args()
 
-    demo = LC10ECsvDemo(args.iface, args.slave_index, args.rpm, args.duration)
+    demo = LC10ECsvDemo(args.iface, args.slave_index, args.rpm, args.duration, args.cycle_ms,
+                        rt_core=args.rt_core, rt_prio=args.rt_prio)
     try:
         demo.run()
     except Exception as exc:  # noqa: BLE001
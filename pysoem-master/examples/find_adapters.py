@@ -1,30 +1,36 @@
 """Print available network adapters and probe each one for attached slaves."""
 
+import concurrent.futures
+
 import pysoem
 
 
 def probe_adapter(adapter):
-    """Open the adapter, run config_init, and report discovered slaves."""
+    """Open the adapter, run config_init, and return a report of discovered slaves."""
+    lines = []
     master = pysoem.Master()
     try:
         master.open(adapter.name)
         slave_count = master.config_init()
         if slave_count > 0:
-            print(f"  Found {slave_count} slave(s):")
-            for idx, slave in enumerate(master.slaves):
-                print(
-                    f"    [{idx}] {slave.name} "
-                    f"(man=0x{slave.man:08x}, id=0x{slave.id:08x}, rev=0x{slave.rev:08x})"
-                )
+            lines.append(f"  Found {slave_count} slave(s):")
+            # Snapshot the fields in one pass over the slave list; every
+            # attribute access is a separate trip into the pysoem C layer.
+            rows = [(s.name, s.man, s.id, s.rev) for s in master.slaves]
+            lines.extend(
+                f"    [{idx}] {name} (man=0x{man:08x}, id=0x{product:08x}, rev=0x{rev:08x})"
+                for idx, (name, man, product, rev) in enumerate(rows)
+            )
         else:
-            print("  No slaves found.")
+            lines.append("  No slaves found.")
     except Exception as exc:  # noqa: BLE001
-        print(f"  Probe failed: {exc}")
+        lines.append(f"  Probe failed: {exc}")
     finally:
         try:
             master.close()
         except Exception:
             pass
+    return "\n".join(lines)
 
 
 def main():
@@ -33,11 +39,16 @@ def main():
         print("No adapters found.")
         return
 
-    for i, adapter in enumerate(adapters):
-        print(f"Adapter {i}")
-        print(f"  {adapter.name}")
-        print(f"  {adapter.desc}")
-        probe_adapter(adapter)
+    # Each probe blocks in config_init for the full bus-scan timeout, so on a
+    # box with several idle NICs the serial version pays N timeouts back to
+    # back.  Probe all adapters in parallel and print the reports in order.
+    with concurrent.futures.ThreadPoolExecutor(max_workers=len(adapters)) as pool:
+        reports = pool.map(probe_adapter, adapters)
+        for i, (adapter, report) in enumerate(zip(adapters, reports)):
+            print(f"Adapter {i}")
+            print(f"  {adapter.name}")
+            print(f"  {adapter.desc}")
+            print(report)
 
 
 if __name__ == "__main__":